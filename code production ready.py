@@ -17,45 +17,240 @@ Version: 2.0.0
 """
 
 import json
+import pickle
 import random
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import logging.handlers
+import queue
+import threading
+import time
+import atexit
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from datetime import datetime
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler with a large write buffer that flushes periodically
+    instead of after every record. Warnings and errors are flushed immediately.
+    """
+
+    def __init__(self, filename: str, flush_interval: float = 30.0,
+                 buffer_size: int = 128 * 1024):
+        """
+        Args:
+            filename: Log file path (opened in append mode)
+            flush_interval: Maximum seconds between flushes
+            buffer_size: Write buffer size in bytes
+        """
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._last_flush = time.monotonic()
+        super().__init__(filename, encoding='utf-8')
+
+        # Flush on a timer too, so an idle process (e.g. waiting on input()) still writes
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically,
+                                         name="log-flush", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    buffering=self.buffer_size)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Unlike StreamHandler.emit, only flush when the record or the interval calls for it
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if (record.levelno >= logging.WARNING
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+
+# File writes happen on a background listener thread; console output stays
+# synchronous so it interleaves correctly with the demo's print() calls
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, BufferedFileHandler('restaurant_system.log')
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('restaurant_system.log'),
+        logging.handlers.QueueHandler(_log_queue),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of restaurant batches queried at once
+MAX_QUERY_WORKERS = 32
+
+# Shared pool for fetching parking and booking data concurrently. Sized so every
+# concurrent batch can run both of its API calls at once (threads start lazily).
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=2 * MAX_QUERY_WORKERS,
+                                   thread_name_prefix="api-fetch")
+
+# Queries per batched API call (see RestaurantInfoSystem.get_restaurant_info_many)
+QUERY_BATCH_SIZE = 64
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Split a list into consecutive chunks of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _compact_json(value) -> str:
+    """Serialize to the compact JSON form used by all API responses"""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def _parse_json(text: str):
+    """Parse a JSON string"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _indented_json(value) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json_file(path: str, data) -> None:
+    """Write data as indented UTF-8 JSON"""
+    with open(path, 'wb') as f:
+        f.write(_indented_json(data))
+
+
+def _write_json_array(path: str, records: Iterable) -> int:
+    """
+    Stream records to an indented JSON array file without holding them in memory.
+
+    Output matches json.dump(list(records), f, indent=2).
+
+    Returns:
+        Number of records written
+    """
+    # Plain buffered writes rather than mmap: the total size is unknown until
+    # the generator is exhausted, and the page cache already defers disk I/O
+    count = 0
+    separator = b'\n  '
+    with open(path, 'wb', buffering=128 * 1024) as f:
+        f.write(b'[')
+        for record in records:
+            f.write(separator + _indented_json(record).replace(b'\n', b'\n  '))
+            separator = b',\n  '
+            count += 1
+        f.write(b'\n]' if count else b']')
+    return count
+
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+def _as_tuple(value):
+    """Convert non-string sequences to tuples; anything else is left for validate() to reject"""
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, tuple)):
+        return tuple(value)
+    return value
+
+
+# Response keys filled in per request, and their slots in the response template
+_LIVE_SLOTS = {"parking_availability": "%(parking)s", "availability_restaurant": "%(booking)s"}
+
+
+@dataclass(slots=True, frozen=True)
 class RestaurantData:
     """Immutable data class for restaurant information"""
     name: str
     location: str
-    top_3_dishes: List[str]
-    cuisines: List[str]
+    top_3_dishes: Tuple[str, ...]
+    cuisines: Tuple[str, ...]
     ambience: str
+    # Response JSON specialized for this restaurant, with slots for the live fields
+    _json_template: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Store sequences as tuples so instances can be shared without defensive copies
+        object.__setattr__(self, 'top_3_dishes', _as_tuple(self.top_3_dishes))
+        object.__setattr__(self, 'cuisines', _as_tuple(self.cuisines))
+
+        members = [f'"{key}":' + (_LIVE_SLOTS[key] if key in _LIVE_SLOTS
+                                  else _compact_json(value).replace('%', '%%'))
+                   for key, value in self.response_items(None, None)]
+        object.__setattr__(self, '_json_template', '{' + ','.join(members) + '}')
+
+    def response_items(self, parking, booking) -> Tuple[Tuple[str, object], ...]:
+        """Response (key, value) pairs in output order; shared by the JSON and dict forms"""
+        return (
+            ("restaurant", self.name),
+            ("location", self.location),
+            ("parking_availability", parking),
+            ("availability_restaurant", booking),
+            ("top_3_dishes", self.top_3_dishes),
+            ("cuisines", self.cuisines),
+            ("ambience", self.ambience)
+        )
+
+    def to_json(self, parking: str, booking: str) -> str:
+        """Build the compact JSON response, serializing only the live fields"""
+        return self._json_template % {'parking': _compact_json(parking),
+                                      'booking': _compact_json(booking)}
+
+    def to_response_dict(self, parking: str, booking: str) -> Dict:
+        """Build the response as a dict shaped like the parsed to_json output"""
+        return {key: list(value) if isinstance(value, tuple) else value
+                for key, value in self.response_items(parking, booking)}
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "location": self.location,
+            "top_3_dishes": list(self.top_3_dishes),
+            "cuisines": list(self.cuisines),
+            "ambience": self.ambience
+        }
 
     def validate(self) -> Tuple[bool, Optional[str]]:
         """Validate data integrity"""
@@ -63,10 +258,10 @@ class RestaurantData:
             return False, "Invalid restaurant name"
         if not self.location or not isinstance(self.location, str):
             return False, "Invalid location"
-        if not isinstance(self.top_3_dishes, list) or len(self.top_3_dishes) != 3:
+        if not isinstance(self.top_3_dishes, tuple) or len(self.top_3_dishes) != 3:
             return False, "top_3_dishes must contain exactly 3 items"
-        if not isinstance(self.cuisines, list) or len(self.cuisines) == 0:
-            return False, "cuisines must be a non-empty list"
+        if not isinstance(self.cuisines, tuple) or len(self.cuisines) == 0:
+            return False, "cuisines must be a non-empty sequence"
         if not self.ambience or not isinstance(self.ambience, str):
             return False, "Invalid ambience"
         return True, None
@@ -84,6 +279,23 @@ class ParkingAPIInterface(ABC):
         """Fetch parking availability"""
         pass
 
+    def get_parking_status_batch(self, locations: List[str]) -> List[Optional[str]]:
+        """
+        Fetch parking availability for many locations.
+
+        Defaults to one call per location. Override to use a provider batch endpoint:
+            response = requests.post(
+                f"{self.base_url}/parking/batch",
+                json={"locations": locations},
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout
+            )
+            if response.status_code == 200:
+                return [self._format_parking_status(item) for item in response.json()]
+            return [None] * len(locations)
+        """
+        return [self.get_parking_status(location) for location in locations]
+
 
 class BookingAPIInterface(ABC):
     """Abstract interface for booking APIs - easily swap with real implementation"""
@@ -93,11 +305,71 @@ class BookingAPIInterface(ABC):
         """Fetch booking availability"""
         pass
 
+    def get_availability_batch(self, restaurant_names: List[str]) -> List[Optional[str]]:
+        """
+        Fetch booking availability for many restaurants.
+
+        Defaults to one call per restaurant. Override to use a provider batch endpoint:
+            response = requests.post(
+                f"{self.base_url}/availability/batch",
+                json={"restaurants": restaurant_names},
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout
+            )
+            if response.status_code == 200:
+                return [self._format_availability(item) for item in response.json()]
+            return [None] * len(restaurant_names)
+        """
+        return [self.get_availability(name) for name in restaurant_names]
+
 
 # ============================================================================
 # SIMULATED APIS (Demo Mode)
 # ============================================================================
 
+# Weekday names indexed by datetime.weekday()
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Realistic parking scenarios
+_PARKING_STATUSES = (
+    "Available now - 15 spots (live)",
+    "Available now - 8 spots (live)",
+    "Limited - 3 spots remaining (live)",
+    "Full - Street parking 2 blocks away (live)",
+    "Valet parking available (live)",
+    "Underground parking - $5/hour (live)",
+    "Free parking after 6pm (live)",
+    "Parking garage adjacent (live)"
+)
+
+# Time-aware booking scenarios
+_MORNING_STATUSES = (
+    "Walk-ins welcome (live)",
+    "Reservations available for lunch (live)",
+    "Book now for dinner (live)"
+)
+_LUNCH_STATUSES = (
+    "Table available at 1:00 PM (live)",
+    "Table available at 1:30 PM (live)",
+    "15 minute wait (live)",
+    "Reserve for dinner - 6:00 PM available (live)"
+)
+_AFTERNOON_STATUSES = (
+    "Walk-ins welcome (live)",
+    "Prime dinner slots available (live)",
+    "Table available at 6:30 PM (live)",
+    "Table available at 7:00 PM (live)"
+)
+_EVENING_STATUSES = (
+    "Table available at 8:00 PM (live)",
+    "Table available at 8:30 PM (live)",
+    "Table available at 9:00 PM (live)",
+    "Fully booked tonight (live)",
+    "Waitlist - 30 min estimated (live)",
+    "Bar seating available now (live)"
+)
+
+
 class SimulatedParkingAPI(ParkingAPIInterface):
     """
     Simulated parking API for demo purposes.
@@ -122,19 +394,21 @@ class SimulatedParkingAPI(ParkingAPIInterface):
             logger.warning(f"Simulated parking API failure for {location}")
             return None
 
-        # Realistic parking scenarios
-        statuses = [
-            "Available now - 15 spots (live)",
-            "Available now - 8 spots (live)",
-            "Limited - 3 spots remaining (live)",
-            "Full - Street parking 2 blocks away (live)",
-            "Valet parking available (live)",
-            "Underground parking - $5/hour (live)",
-            "Free parking after 6pm (live)",
-            "Parking garage adjacent (live)"
-        ]
-
-        return random.choice(statuses)
+        return random.choice(_PARKING_STATUSES)
+
+    def get_parking_status_batch(self, locations: List[str]) -> List[Optional[str]]:
+        """Simulates parking responses for many locations with batched random draws"""
+        picks = random.choices(_PARKING_STATUSES, k=len(locations))
+        results: List[Optional[str]] = []
+        for location, status in zip(locations, picks):
+            if not location:
+                results.append(None)
+            elif random.random() > self.reliability:
+                logger.warning(f"Simulated parking API failure for {location}")
+                results.append(None)
+            else:
+                results.append(status)
+        return results
 
 
 class SimulatedBookingAPI(BookingAPIInterface):
@@ -143,12 +417,18 @@ class SimulatedBookingAPI(BookingAPIInterface):
     Replace with RealBookingAPI for production.
     """
 
-    def __init__(self, reliability: float = 0.95):
+    def __init__(self, reliability: float = 0.95,
+                 clock: Callable[[], datetime] = datetime.now):
         """
         Args:
             reliability: Success rate (0.0 to 1.0). Default 95% for realistic demo.
+            clock: Returns the current time. Override for deterministic demos/tests.
         """
         self.reliability = max(0.0, min(1.0, reliability))
+        self.clock = clock
+        # Statuses only change with the hour, so cache them per hour bucket.
+        # Key and statuses live in one tuple so concurrent readers never see a mix.
+        self._statuses_cache: Optional[Tuple[Tuple, Tuple[str, ...]]] = None
         logger.info(f"SimulatedBookingAPI initialized (reliability={self.reliability})")
 
     def get_availability(self, restaurant_name: str) -> Optional[str]:
@@ -161,43 +441,43 @@ class SimulatedBookingAPI(BookingAPIInterface):
             logger.warning(f"Simulated booking API failure for {restaurant_name}")
             return None
 
-        # Time-aware realistic scenarios
-        now = datetime.now()
+        return random.choice(self._statuses())
+
+    def get_availability_batch(self, restaurant_names: List[str]) -> List[Optional[str]]:
+        """Simulates booking responses for many restaurants with batched random draws"""
+        picks = random.choices(self._statuses(), k=len(restaurant_names))
+        results: List[Optional[str]] = []
+        for restaurant_name, status in zip(restaurant_names, picks):
+            if not restaurant_name:
+                results.append(None)
+            elif random.random() > self.reliability:
+                logger.warning(f"Simulated booking API failure for {restaurant_name}")
+                results.append(None)
+            else:
+                results.append(status)
+        return results
+
+    def _statuses(self) -> Tuple[str, ...]:
+        """Time-aware realistic scenarios"""
+        now = self.clock()
         hour = now.hour
-        day_name = (now + timedelta(days=1)).strftime('%A')
+        key = (now.date(), hour)
+        cache = self._statuses_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
 
         if hour < 11:  # Morning
-            statuses = [
-                "Walk-ins welcome (live)",
-                "Reservations available for lunch (live)",
-                "Book now for dinner (live)"
-            ]
+            statuses = _MORNING_STATUSES
         elif 11 <= hour < 14:  # Lunch
-            statuses = [
-                "Table available at 1:00 PM (live)",
-                "Table available at 1:30 PM (live)",
-                "15 minute wait (live)",
-                "Reserve for dinner - 6:00 PM available (live)"
-            ]
+            statuses = _LUNCH_STATUSES
         elif 14 <= hour < 17:  # Afternoon
-            statuses = [
-                "Walk-ins welcome (live)",
-                "Prime dinner slots available (live)",
-                "Table available at 6:30 PM (live)",
-                "Table available at 7:00 PM (live)"
-            ]
+            statuses = _AFTERNOON_STATUSES
         else:  # Dinner/Evening
-            statuses = [
-                "Table available at 8:00 PM (live)",
-                "Table available at 8:30 PM (live)",
-                "Table available at 9:00 PM (live)",
-                "Fully booked tonight (live)",
-                "Waitlist - 30 min estimated (live)",
-                f"Next available: {day_name} 6:00 PM (live)",
-                "Bar seating available now (live)"
-            ]
+            day_name = _WEEKDAYS[(now.weekday() + 1) % 7]
+            statuses = _EVENING_STATUSES + (f"Next available: {day_name} 6:00 PM (live)",)
 
-        return random.choice(statuses)
+        self._statuses_cache = (key, statuses)
+        return statuses
 
 
 # ============================================================================
@@ -286,83 +566,107 @@ class RealBookingAPI(BookingAPIInterface):
 # DATABASE
 # ============================================================================
 
+# Static demo data: name -> restaurant fields
+DEMO_RESTAURANTS: Dict[str, Dict] = {
+    "Pizza Place XYZ": {
+        "location": "123 Main St, Toronto, ON M5H 2N2",
+        "top_3_dishes": ["Margherita Pizza", "Truffle Fries", "Tiramisu"],
+        "cuisines": ["Italian"],
+        "ambience": "Casual, family-friendly"
+    },
+    "Sushi Haven": {
+        "location": "456 Queen St W, Toronto, ON M5V 2A8",
+        "top_3_dishes": ["Dragon Roll", "Salmon Sashimi", "Miso Soup"],
+        "cuisines": ["Japanese", "Sushi"],
+        "ambience": "Modern, minimalist with zen aesthetics"
+    },
+    "Le Bistro Français": {
+        "location": "789 King St E, Toronto, ON M5A 1M2",
+        "top_3_dishes": ["Coq au Vin", "Escargot", "Crème Brûlée"],
+        "cuisines": ["French"],
+        "ambience": "Elegant, romantic with soft lighting"
+    },
+    "Spice Route": {
+        "location": "321 Bloor St, Toronto, ON M5S 1V8",
+        "top_3_dishes": ["Butter Chicken", "Lamb Biryani", "Garlic Naan"],
+        "cuisines": ["Indian", "North Indian"],
+        "ambience": "Vibrant, colorful with traditional decor"
+    },
+    "The Steakhouse": {
+        "location": "555 Bay St, Toronto, ON M5G 2C2",
+        "top_3_dishes": ["Ribeye Steak", "Lobster Tail", "Caesar Salad"],
+        "cuisines": ["Steakhouse", "American"],
+        "ambience": "Upscale, dimly lit with leather seating"
+    },
+    "Green Garden Café": {
+        "location": "222 College St, Toronto, ON M5T 1R9",
+        "top_3_dishes": ["Quinoa Bowl", "Avocado Toast", "Acai Bowl"],
+        "cuisines": ["Vegan", "Vegetarian", "Healthy"],
+        "ambience": "Bright, airy with plants and natural wood"
+    },
+    "Taco Fiesta": {
+        "location": "888 Dundas St W, Toronto, ON M6J 1V5",
+        "top_3_dishes": ["Fish Tacos", "Carne Asada", "Churros"],
+        "cuisines": ["Mexican", "Latin American"],
+        "ambience": "Lively, colorful with festive atmosphere"
+    },
+    "Dragon Wok": {
+        "location": "999 Spadina Ave, Toronto, ON M5S 2J5",
+        "top_3_dishes": ["Peking Duck", "Kung Pao Chicken", "Dumplings"],
+        "cuisines": ["Chinese", "Cantonese"],
+        "ambience": "Traditional with red lanterns and wooden decor"
+    },
+    "Burger Barn": {
+        "location": "777 Yonge St, Toronto, ON M4Y 2B6",
+        "top_3_dishes": ["Classic Burger", "Sweet Potato Fries", "Milkshake"],
+        "cuisines": ["American", "Burgers"],
+        "ambience": "Retro diner style with vinyl booths"
+    },
+    "Mediterranean Breeze": {
+        "location": "444 Harbord St, Toronto, ON M6G 1H4",
+        "top_3_dishes": ["Lamb Souvlaki", "Greek Salad", "Baklava"],
+        "cuisines": ["Mediterranean", "Greek"],
+        "ambience": "Coastal-inspired with blue and white decor"
+    }
+}
+
+
 class RestaurantDatabase:
     """
     Static restaurant database.
     In production, this could be replaced with PostgreSQL, MongoDB, etc.
     """
 
-    def __init__(self):
+    def __init__(self, data_file: Optional[str] = None):
+        """
+        Args:
+            data_file: Optional pickle file written by build_data_file. Loads
+                faster than Python literals for large databases. Only load
+                trusted files. Defaults to the built-in demo data.
+        """
         self._restaurants: Dict[str, RestaurantData] = {}
-        self._load_demo_data()
+        self._index: Dict[str, RestaurantData] = {}  # casefolded name -> restaurant
+        if data_file:
+            self._load_data_file(data_file)
+        else:
+            self._load_demo_data()
+        # Names are fixed after loading; rebuild this if add/remove is ever supported
+        self._sorted_names: Tuple[str, ...] = tuple(sorted(self._restaurants))
         logger.info(f"RestaurantDatabase initialized with {len(self._restaurants)} restaurants")
 
     def _load_demo_data(self) -> None:
         """Load demo restaurant data"""
-        demo_restaurants = {
-            "Pizza Place XYZ": {
-                "location": "123 Main St, Toronto, ON M5H 2N2",
-                "top_3_dishes": ["Margherita Pizza", "Truffle Fries", "Tiramisu"],
-                "cuisines": ["Italian"],
-                "ambience": "Casual, family-friendly"
-            },
-            "Sushi Haven": {
-                "location": "456 Queen St W, Toronto, ON M5V 2A8",
-                "top_3_dishes": ["Dragon Roll", "Salmon Sashimi", "Miso Soup"],
-                "cuisines": ["Japanese", "Sushi"],
-                "ambience": "Modern, minimalist with zen aesthetics"
-            },
-            "Le Bistro Français": {
-                "location": "789 King St E, Toronto, ON M5A 1M2",
-                "top_3_dishes": ["Coq au Vin", "Escargot", "Crème Brûlée"],
-                "cuisines": ["French"],
-                "ambience": "Elegant, romantic with soft lighting"
-            },
-            "Spice Route": {
-                "location": "321 Bloor St, Toronto, ON M5S 1V8",
-                "top_3_dishes": ["Butter Chicken", "Lamb Biryani", "Garlic Naan"],
-                "cuisines": ["Indian", "North Indian"],
-                "ambience": "Vibrant, colorful with traditional decor"
-            },
-            "The Steakhouse": {
-                "location": "555 Bay St, Toronto, ON M5G 2C2",
-                "top_3_dishes": ["Ribeye Steak", "Lobster Tail", "Caesar Salad"],
-                "cuisines": ["Steakhouse", "American"],
-                "ambience": "Upscale, dimly lit with leather seating"
-            },
-            "Green Garden Café": {
-                "location": "222 College St, Toronto, ON M5T 1R9",
-                "top_3_dishes": ["Quinoa Bowl", "Avocado Toast", "Acai Bowl"],
-                "cuisines": ["Vegan", "Vegetarian", "Healthy"],
-                "ambience": "Bright, airy with plants and natural wood"
-            },
-            "Taco Fiesta": {
-                "location": "888 Dundas St W, Toronto, ON M6J 1V5",
-                "top_3_dishes": ["Fish Tacos", "Carne Asada", "Churros"],
-                "cuisines": ["Mexican", "Latin American"],
-                "ambience": "Lively, colorful with festive atmosphere"
-            },
-            "Dragon Wok": {
-                "location": "999 Spadina Ave, Toronto, ON M5S 2J5",
-                "top_3_dishes": ["Peking Duck", "Kung Pao Chicken", "Dumplings"],
-                "cuisines": ["Chinese", "Cantonese"],
-                "ambience": "Traditional with red lanterns and wooden decor"
-            },
-            "Burger Barn": {
-                "location": "777 Yonge St, Toronto, ON M4Y 2B6",
-                "top_3_dishes": ["Classic Burger", "Sweet Potato Fries", "Milkshake"],
-                "cuisines": ["American", "Burgers"],
-                "ambience": "Retro diner style with vinyl booths"
-            },
-            "Mediterranean Breeze": {
-                "location": "444 Harbord St, Toronto, ON M6G 1H4",
-                "top_3_dishes": ["Lamb Souvlaki", "Greek Salad", "Baklava"],
-                "cuisines": ["Mediterranean", "Greek"],
-                "ambience": "Coastal-inspired with blue and white decor"
-            }
-        }
+        # Built-in data is known-good; only re-check it in debug runs (skipped under -O)
+        self._load_records(DEMO_RESTAURANTS, validate=__debug__)
+
+    def _load_data_file(self, path: str) -> None:
+        """Load pre-serialized restaurant data"""
+        with open(path, 'rb') as f:
+            self._load_records(pickle.load(f))
 
-        for name, data in demo_restaurants.items():
+    def _load_records(self, records: Dict[str, Dict], validate: bool = True) -> None:
+        """Validate (optionally) and index restaurant records"""
+        for name, data in records.items():
             try:
                 restaurant = RestaurantData(
                     name=name,
@@ -371,39 +675,49 @@ class RestaurantDatabase:
                     cuisines=data["cuisines"],
                     ambience=data["ambience"]
                 )
-                is_valid, error = restaurant.validate()
+                is_valid, error = restaurant.validate() if validate else (True, None)
                 if is_valid:
                     self._restaurants[name] = restaurant
+                    self._index[name.casefold()] = restaurant
                 else:
                     logger.error(f"Invalid restaurant data for {name}: {error}")
             except Exception as e:
                 logger.error(f"Error loading restaurant {name}: {str(e)}")
 
     def get_restaurant(self, name: str) -> Optional[RestaurantData]:
-        """Get restaurant by name (case-insensitive)"""
-        if not name or not isinstance(name, str):
+        """Get restaurant by name (case-insensitive, Unicode-aware)"""
+        if not isinstance(name, str):
             return None
 
-        name_normalized = name.strip()
-        for key, value in self._restaurants.items():
-            if key.lower() == name_normalized.lower():
-                return value
-
-        return None
+        return self._index.get(name.strip().casefold())
 
     def get_all_restaurant_names(self) -> List[str]:
         """Get all restaurant names"""
-        return sorted(list(self._restaurants.keys()))
+        return list(self._sorted_names)
 
     def get_restaurant_count(self) -> int:
         """Get total restaurant count"""
         return len(self._restaurants)
 
 
+def build_data_file(path: str = 'demo_data.pkl',
+                    records: Dict[str, Dict] = DEMO_RESTAURANTS) -> None:
+    """Pre-serialize restaurant records for RestaurantDatabase(data_file=...)"""
+    with open(path, 'wb') as f:
+        pickle.dump(records, f, protocol=5)
+
+
 # ============================================================================
 # MAIN SYSTEM
 # ============================================================================
 
+# Fallback shown when a live API returns nothing
+UNAVAILABLE = "Unavailable at the moment"
+
+# Result type produced by the response builders
+T = TypeVar('T')
+
+
 class RestaurantInfoSystem:
     """
     Main system orchestrating all components.
@@ -413,7 +727,8 @@ class RestaurantInfoSystem:
     def __init__(self,
                  database: RestaurantDatabase,
                  parking_api: ParkingAPIInterface,
-                 booking_api: BookingAPIInterface):
+                 booking_api: BookingAPIInterface,
+                 parallel_fetch: bool = False):
         """
         Initialize system with dependency injection for easy testing/swapping
 
@@ -421,16 +736,43 @@ class RestaurantInfoSystem:
             database: Restaurant database instance
             parking_api: Any class implementing ParkingAPIInterface
             booking_api: Any class implementing BookingAPIInterface
+            parallel_fetch: Call both APIs concurrently. Enable for network-backed
+                APIs; the simulated ones are faster without the thread hand-off.
         """
         self.db = database
         self.parking_api = parking_api
         self.booking_api = booking_api
+        self.parallel_fetch = parallel_fetch
         logger.info("RestaurantInfoSystem initialized")
 
     def get_restaurant_info(self, restaurant_name: str) -> str:
         """
         Main method: Get complete restaurant information as JSON
 
+        Args:
+            restaurant_name: Name of restaurant to query
+
+        Returns:
+            Compact JSON string with restaurant data or error
+        """
+        return self._query(restaurant_name, self._build_response, self._error_response)
+
+    def get_restaurant_dict(self, restaurant_name: str) -> Dict:
+        """
+        Get complete restaurant information as a dict, skipping JSON encoding
+
+        Args:
+            restaurant_name: Name of restaurant to query
+
+        Returns:
+            Dict with the same shape as the parsed get_restaurant_info output
+        """
+        return self._query(restaurant_name, self._build_dict, self._error_dict)
+
+    async def get_restaurant_info_async(self, restaurant_name: str) -> str:
+        """
+        Async variant of get_restaurant_info; both APIs are always called concurrently
+
         Args:
             restaurant_name: Name of restaurant to query
 
@@ -438,43 +780,167 @@ class RestaurantInfoSystem:
             Compact JSON string with restaurant data or error
         """
         try:
-            # Input validation
-            if not restaurant_name or not isinstance(restaurant_name, str):
-                return self._error_response("Invalid restaurant name")
+            restaurant, restaurant_name, error = self._resolve(restaurant_name)
+            if error:
+                return self._error_response(error)
 
-            restaurant_name = restaurant_name.strip()
-            if not restaurant_name:
-                return self._error_response("Restaurant name cannot be empty")
+            parking, booking = await asyncio.gather(
+                asyncio.to_thread(self.parking_api.get_parking_status, restaurant.location),
+                asyncio.to_thread(self.booking_api.get_availability, restaurant_name)
+            )
+
+            return self._build_response(restaurant, parking, booking)
+
+        except Exception as e:
+            logger.exception(f"Error in get_restaurant_info_async: {str(e)}")
+            return self._error_response("System error occurred")
+
+    def get_restaurant_info_many(self, restaurant_names: List[str]) -> List[str]:
+        """
+        Get restaurant information for many names with one call per API
 
-            # Fetch static data
-            restaurant = self.db.get_restaurant(restaurant_name)
-            if not restaurant:
-                return self._error_response(f"Restaurant '{restaurant_name}' not found")
+        Args:
+            restaurant_names: Names of restaurants to query
+
+        Returns:
+            Compact JSON strings (data or error), in the same order as the input
+        """
+        return self._query_many(restaurant_names, self._build_response, self._error_response)
+
+    def get_restaurant_dict_many(self, restaurant_names: List[str]) -> List[Dict]:
+        """
+        Batched get_restaurant_dict with one call per API
+
+        Args:
+            restaurant_names: Names of restaurants to query
+
+        Returns:
+            Dicts (data or error), in the same order as the input
+        """
+        return self._query_many(restaurant_names, self._build_dict, self._error_dict)
+
+    def _query(self, restaurant_name: str,
+               build: Callable[[RestaurantData, Optional[str], Optional[str]], T],
+               error_response: Callable[[str], T]) -> T:
+        """Look up one restaurant, fetch its live data and build the result"""
+        try:
+            restaurant, restaurant_name, error = self._resolve(restaurant_name)
+            if error:
+                return error_response(error)
 
             # Fetch live data (with fallback)
-            parking = self.parking_api.get_parking_status(restaurant.location)
-            booking = self.booking_api.get_availability(restaurant_name)
-
-            # Build response
-            response = {
-                "restaurant": restaurant.name,
-                "location": restaurant.location,
-                "parking_availability": parking if parking else "Unavailable at the moment",
-                "availability_restaurant": booking if booking else "Unavailable at the moment",
-                "top_3_dishes": restaurant.top_3_dishes,
-                "cuisines": restaurant.cuisines,
-                "ambience": restaurant.ambience
-            }
-
-            return json.dumps(response, separators=(',', ':'), ensure_ascii=False)
+            if self.parallel_fetch:
+                parking_future = _API_EXECUTOR.submit(
+                    self.parking_api.get_parking_status, restaurant.location)
+                booking_future = _API_EXECUTOR.submit(
+                    self.booking_api.get_availability, restaurant_name)
+                parking = parking_future.result()
+                booking = booking_future.result()
+            else:
+                parking = self.parking_api.get_parking_status(restaurant.location)
+                booking = self.booking_api.get_availability(restaurant_name)
+
+            return build(restaurant, parking, booking)
 
         except Exception as e:
-            logger.exception(f"Error in get_restaurant_info: {str(e)}")
-            return self._error_response("System error occurred")
+            logger.exception(f"Error querying restaurant: {str(e)}")
+            return error_response("System error occurred")
+
+    def _query_many(self, restaurant_names: List[str],
+                    build: Callable[[RestaurantData, Optional[str], Optional[str]], T],
+                    error_response: Callable[[str], T]) -> List[T]:
+        """Look up many restaurants, fetch live data in batches and build the results"""
+        results: List[Optional[T]] = [None] * len(restaurant_names)
+        pending: List[Tuple[int, RestaurantData, str]] = []
+
+        for i, restaurant_name in enumerate(restaurant_names):
+            restaurant, restaurant_name, error = self._resolve(restaurant_name)
+            if error:
+                results[i] = error_response(error)
+            else:
+                pending.append((i, restaurant, restaurant_name))
+
+        if not pending:
+            return results
+
+        try:
+            locations = [restaurant.location for _, restaurant, _ in pending]
+            names = [name for _, _, name in pending]
+
+            # Fetch live data (with fallback)
+            if self.parallel_fetch:
+                parking_future = _API_EXECUTOR.submit(self._parking_batch, locations)
+                booking_future = _API_EXECUTOR.submit(self._booking_batch, names)
+                parkings = parking_future.result()
+                bookings = booking_future.result()
+            else:
+                parkings = self._parking_batch(locations)
+                bookings = self._booking_batch(names)
+
+            # strict: a batch API returning the wrong number of results is an error
+            for (i, restaurant, _), parking, booking in zip(pending, parkings, bookings,
+                                                            strict=True):
+                results[i] = build(restaurant, parking, booking)
+
+        except Exception as e:
+            logger.exception(f"Error in batched restaurant query: {str(e)}")
+            for i, _, _ in pending:
+                results[i] = error_response("System error occurred")
+
+        return results
+
+    def _parking_batch(self, locations: List[str]) -> List[Optional[str]]:
+        """Batched parking lookup, falling back to per-item calls for APIs without one"""
+        batch = getattr(self.parking_api, 'get_parking_status_batch', None)
+        if batch is None:
+            return [self.parking_api.get_parking_status(location) for location in locations]
+        return batch(locations)
+
+    def _booking_batch(self, restaurant_names: List[str]) -> List[Optional[str]]:
+        """Batched booking lookup, falling back to per-item calls for APIs without one"""
+        batch = getattr(self.booking_api, 'get_availability_batch', None)
+        if batch is None:
+            return [self.booking_api.get_availability(name) for name in restaurant_names]
+        return batch(restaurant_names)
+
+    def _resolve(self, restaurant_name: str) -> Tuple[Optional[RestaurantData], str, Optional[str]]:
+        """Validate input and look up the restaurant; returns (restaurant, name, error)"""
+        if not isinstance(restaurant_name, str) or not restaurant_name:
+            return None, "", "Invalid restaurant name"
+
+        restaurant_name = restaurant_name.strip()
+        if not restaurant_name:
+            return None, "", "Restaurant name cannot be empty"
+
+        restaurant = self.db.get_restaurant(restaurant_name)
+        if not restaurant:
+            return None, restaurant_name, f"Restaurant '{restaurant_name}' not found"
+
+        return restaurant, restaurant_name, None
+
+    def _build_response(self, restaurant: RestaurantData,
+                        parking: Optional[str], booking: Optional[str]) -> str:
+        """Build response (static fields are pre-serialized per restaurant)"""
+        return restaurant.to_json(
+            parking if parking else UNAVAILABLE,
+            booking if booking else UNAVAILABLE
+        )
+
+    def _build_dict(self, restaurant: RestaurantData,
+                    parking: Optional[str], booking: Optional[str]) -> Dict:
+        """Build response as a dict"""
+        return restaurant.to_response_dict(
+            parking if parking else UNAVAILABLE,
+            booking if booking else UNAVAILABLE
+        )
 
     def _error_response(self, message: str) -> str:
         """Create standardized error response"""
-        return json.dumps({"error": message}, separators=(',', ':'))
+        return _compact_json(self._error_dict(message))
+
+    def _error_dict(self, message: str) -> Dict:
+        """Create standardized error response as a dict"""
+        return {"error": message}
 
     def get_all_restaurants(self) -> List[str]:
         """Get list of all available restaurants"""
@@ -497,10 +963,12 @@ class DemoRunner:
         print("🍽️  RESTAURANT INFORMATION SYSTEM - INTERACTIVE DEMO")
         print("=" * 80)
 
+        restaurants = self.system.get_all_restaurants()
+
         while True:
             print("\n" + "-" * 80)
             print("Available Restaurants:")
-            for i, name in enumerate(self.system.get_all_restaurants(), 1):
+            for i, name in enumerate(restaurants, 1):
                 print(f"  {i}. {name}")
 
             print("\nOptions:")
@@ -515,13 +983,11 @@ class DemoRunner:
                 print("\n👋 Demo ended. Thank you!\n")
                 break
             elif choice.lower() == 'random':
-                restaurants = self.system.get_all_restaurants()
                 self._display_restaurant(random.choice(restaurants))
             elif choice.lower() == 'all':
                 self._query_all_restaurants()
             elif choice.isdigit():
                 idx = int(choice) - 1
-                restaurants = self.system.get_all_restaurants()
                 if 0 <= idx < len(restaurants):
                     self._display_restaurant(restaurants[idx])
                 else:
@@ -531,28 +997,35 @@ class DemoRunner:
 
     def _display_restaurant(self, name: str):
         """Display single restaurant info with formatting"""
-        print("\n" + "=" * 80)
+        # Separator goes out first so API warnings logged during the query follow it
+        sys.stdout.write("\n" + "=" * 80 + "\n")
         result = self.system.get_restaurant_info(name)
+        lines = []
 
         try:
-            data = json.loads(result)
+            data = _parse_json(result)
             if "error" in data:
-                print(f"❌ Error: {data['error']}")
+                lines.append(f"❌ Error: {data['error']}")
             else:
-                print(f"🍽️  {data['restaurant']}")
-                print("-" * 80)
-                print(f"📍 Location: {data['location']}")
-                print(f"🚗 Parking: {data['parking_availability']}")
-                print(f"📅 Booking: {data['availability_restaurant']}")
-                print(f"\n⭐ Top 3 Dishes:")
+                lines.append(f"🍽️  {data['restaurant']}")
+                lines.append("-" * 80)
+                lines.append(f"📍 Location: {data['location']}")
+                lines.append(f"🚗 Parking: {data['parking_availability']}")
+                lines.append(f"📅 Booking: {data['availability_restaurant']}")
+                lines.append(f"\n⭐ Top 3 Dishes:")
                 for i, dish in enumerate(data['top_3_dishes'], 1):
-                    print(f"   {i}. {dish}")
-                print(f"\n🍴 Cuisines: {', '.join(data['cuisines'])}")
-                print(f"🎨 Ambience: {data['ambience']}")
-                print(f"\n📋 JSON Output:")
-                print(result)
+                    lines.append(f"   {i}. {dish}")
+                lines.append(f"\n🍴 Cuisines: {', '.join(data['cuisines'])}")
+                lines.append(f"🎨 Ambience: {data['ambience']}")
+                lines.append(f"\n📋 JSON Output:")
+                lines.append(result)
         except:
-            print(result)
+            lines.append(result)
+
+        # One write instead of a print() per line
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     def _query_all_restaurants(self):
         """Query all restaurants and display summary"""
@@ -561,78 +1034,80 @@ class DemoRunner:
         print("=" * 80)
 
         restaurants = self.system.get_all_restaurants()
-        results = []
 
-        for name in restaurants:
-            result = self.system.get_restaurant_info(name)
-            results.append((name, result))
+        batches = list(_chunks(restaurants, QUERY_BATCH_SIZE))
+        if len(batches) <= 1:
+            infos = self.system.get_restaurant_dict_many(restaurants)
+        else:
+            # Batches are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=min(MAX_QUERY_WORKERS, len(batches))) as executor:
+                infos = [info
+                         for batch_infos in executor.map(self.system.get_restaurant_dict_many,
+                                                         batches)
+                         for info in batch_infos]
+        results = list(zip(restaurants, infos))
+
+        for name, _ in results:
             print(f"✓ {name}")
 
         print(f"\n✅ Successfully queried {len(results)} restaurants")
 
-        # Save to file
-        output = [{"restaurant": name, "data": json.loads(data)}
+        # Save to file (encoded once, at write time)
+        output = [{"restaurant": name, "data": data}
                   for name, data in results]
 
-        with open('all_restaurants_demo.json', 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        _write_json_file('all_restaurants_demo.json', output)
 
         print(f"💾 Results saved to: all_restaurants_demo.json")
 
 
-def generate_demo_datasets(system: RestaurantInfoSystem,
-                           training_samples: int = 100,
-                           test_samples: int = 30):
-    """Generate training and test datasets"""
-    print("\n" + "=" * 80)
-    print("📊 GENERATING DATASETS")
-    print("=" * 80)
+def _query_batched(system: RestaurantInfoSystem,
+                   names: List[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (name, result) pairs, querying the APIs in batches"""
+    for batch in _chunks(names, QUERY_BATCH_SIZE):
+        yield from zip(batch, system.get_restaurant_info_many(batch))
 
-    restaurants = system.get_all_restaurants()
 
-    # Training data
-    print(f"\nGenerating {training_samples} training samples...")
-    training_data = []
-    for i in range(training_samples):
-        restaurant = random.choice(restaurants)
-        result = system.get_restaurant_info(restaurant)
-        training_data.append({
+def _training_samples(system: RestaurantInfoSystem, restaurants: List[str],
+                      count: int, timestamp: str) -> Iterator[Dict]:
+    """Yield training samples one at a time"""
+    picks = random.choices(restaurants, k=count)
+    for i, (restaurant, result) in enumerate(_query_batched(system, picks)):
+        yield {
             "id": i + 1,
             "input": restaurant,
             "output": result,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": timestamp
+        }
 
-    with open('training_data.json', 'w', encoding='utf-8') as f:
-        json.dump(training_data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Training data saved: training_data.json ({len(training_data)} samples)")
 
-    # Test data
-    print(f"\nGenerating {test_samples} test samples...")
-    test_data = []
+def _test_samples(system: RestaurantInfoSystem, restaurants: List[str],
+                  count: int, timestamp: str) -> Iterator[Dict]:
+    """Yield test samples one at a time"""
+    sample_id = 0
 
     # Include each restaurant at least once
-    for i, restaurant in enumerate(restaurants):
-        result = system.get_restaurant_info(restaurant)
-        test_data.append({
-            "id": i + 1,
+    for restaurant, result in _query_batched(system, restaurants):
+        sample_id += 1
+        yield {
+            "id": sample_id,
             "input": restaurant,
             "output": result,
             "test_type": "full_coverage",
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": timestamp
+        }
 
     # Add random samples
-    for i in range(test_samples - len(restaurants)):
-        restaurant = random.choice(restaurants)
-        result = system.get_restaurant_info(restaurant)
-        test_data.append({
-            "id": len(test_data) + 1,
+    picks = random.choices(restaurants, k=max(0, count - len(restaurants)))
+    for restaurant, result in _query_batched(system, picks):
+        sample_id += 1
+        yield {
+            "id": sample_id,
             "input": restaurant,
             "output": result,
             "test_type": "random_sample",
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": timestamp
+        }
 
     # Add error cases
     error_cases = [
@@ -640,19 +1115,43 @@ def generate_demo_datasets(system: RestaurantInfoSystem,
         "",
         "   "
     ]
-    for error_input in error_cases:
-        result = system.get_restaurant_info(error_input)
-        test_data.append({
-            "id": len(test_data) + 1,
+    for error_input, result in _query_batched(system, error_cases):
+        sample_id += 1
+        yield {
+            "id": sample_id,
             "input": error_input,
             "output": result,
             "test_type": "error_handling",
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": timestamp
+        }
 
-    with open('test_data.json', 'w', encoding='utf-8') as f:
-        json.dump(test_data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Test data saved: test_data.json ({len(test_data)} samples)")
+
+def generate_demo_datasets(system: RestaurantInfoSystem,
+                           training_samples: int = 100,
+                           test_samples: int = 30):
+    """Generate training and test datasets, streaming each sample to disk"""
+    print("\n" + "=" * 80)
+    print("📊 GENERATING DATASETS")
+    print("=" * 80)
+
+    restaurants = system.get_all_restaurants()
+    timestamp = datetime.now().isoformat()
+
+    # Training data
+    print(f"\nGenerating {training_samples} training samples...")
+    written = _write_json_array(
+        'training_data.json',
+        _training_samples(system, restaurants, training_samples, timestamp)
+    )
+    print(f"✅ Training data saved: training_data.json ({written} samples)")
+
+    # Test data
+    print(f"\nGenerating {test_samples} test samples...")
+    written = _write_json_array(
+        'test_data.json',
+        _test_samples(system, restaurants, test_samples, timestamp)
+    )
+    print(f"✅ Test data saved: test_data.json ({written} samples)")
 
 
 # ============================================================================